@@ -4,6 +4,7 @@ from uas_standards.eurocae_ed318 import (
     CodeAuthorityRole,
     CodeZoneType,
     ED318Schema,
+    Feature,
     TextShortType,
 )
 
@@ -181,6 +182,28 @@ def _role_for(_type: CodeZoneType) -> CodeAuthorityRole:
         raise ValueError(f"CodeAuthorityRole not known for CodeZoneType '{_type}'")
 
 
+def adjust_feature(f: Feature) -> Feature:
+    """
+    Adjust a single ED318 feature in place to comply with Swiss FOCA requirements.
+
+    See adjust for the limitations of the adjustments.
+    """
+    if f.properties is not None:
+        original_restriction_conditions = f.properties.restrictionConditions
+        original_type = f.properties.type
+        f.properties.restrictionConditions = _adjust_restriction_conditions(
+            original_restriction_conditions, original_type
+        )
+        f.properties.extendedProperties = _extended_properties_for(
+            original_restriction_conditions, original_type
+        )
+        if "zoneAuthority" in f.properties:
+            for za in f.properties.zoneAuthority:
+                za.purpose = _role_for(original_type)
+
+    return f
+
+
 def adjust(ed318_data: ED318Schema) -> dict[str, Any]:
     """
     Adjust the ED318 schema to comply with Swiss FOCA requirements.
@@ -189,17 +212,6 @@ def adjust(ed318_data: ED318Schema) -> dict[str, Any]:
     """
     adjusted: dict[str, Any] = ed318_data
     for f in adjusted.features:
-        if f.properties is not None:
-            original_restriction_conditions = f.properties.restrictionConditions
-            original_type = f.properties.type
-            f.properties.restrictionConditions = _adjust_restriction_conditions(
-                original_restriction_conditions, original_type
-            )
-            f.properties.extendedProperties = _extended_properties_for(
-                original_restriction_conditions, original_type
-            )
-            if "zoneAuthority" in f.properties:
-                for za in f.properties.zoneAuthority:
-                    za.purpose = _role_for(original_type)
+        adjust_feature(f)
 
     return adjusted
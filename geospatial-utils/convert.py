@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 
 from config import ED318Additions
@@ -9,6 +10,7 @@ from uas_standards.eurocae_ed269 import (
     Restriction,
     UASZoneAirspaceVolume,
     UASZoneAuthority,
+    UASZoneVersion,
     UomDimensions,
 )
 from uas_standards.eurocae_ed318 import (
@@ -121,11 +123,9 @@ def _convert_applicability(a: ApplicableTimePeriod) -> TimePeriod | None:
     return time_period if len(time_period) > 0 else None
 
 
-def from_ed269_to_ed318(ed269_data: ED269Schema, config: ED318Additions) -> ED318Schema:
-    """Convert ED269 data to ED318 data.
-    Missing data in the new format is provided as a config."""
-
-    dataset_metadata = DatasetMetadata(
+def to_ed318_metadata(config: ED318Additions) -> DatasetMetadata:
+    """Build the ED318 dataset metadata from the config."""
+    return DatasetMetadata(
         validFrom=datetime.now(UTC).isoformat(),
         validTo=None,
         provider=config.provider,
@@ -134,8 +134,14 @@ def from_ed269_to_ed318(ed269_data: ED269Schema, config: ED318Additions) -> ED31
         otherGeoid=config.otherGeoid,
     )
 
-    features: list[Feature] = []
-    for i, zv in enumerate(ed269_data.features):
+
+def iter_ed318_features(
+    ed269_features: Iterable[UASZoneVersion], config: ED318Additions
+) -> Iterator[Feature]:
+    """Convert ED269 zones to ED318 features one at a time.
+    Missing data in the new format is provided as a config."""
+
+    for i, zv in enumerate(ed269_features):
         zone_authority: list[Authority] = []
         for za in zv.zoneAuthority:
             zone_authority.append(_convert_authority(za, config.default_lang))
@@ -210,10 +216,15 @@ def from_ed269_to_ed318(ed269_data: ED269Schema, config: ED318Additions) -> ED31
             geometry=geometry,
         )
 
-        features.append(feature)
+        yield feature
+
+
+def from_ed269_to_ed318(ed269_data: ED269Schema, config: ED318Additions) -> ED318Schema:
+    """Convert ED269 data to ED318 data.
+    Missing data in the new format is provided as a config."""
 
     return ED318Schema(
         type="FeatureCollection",
-        metadata=dataset_metadata,
-        features=features,
+        metadata=to_ed318_metadata(config),
+        features=list(iter_ed318_features(ed269_data.features, config)),
     )
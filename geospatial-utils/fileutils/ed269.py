@@ -1,9 +1,113 @@
 import json
 import pathlib
+from collections.abc import Iterator
+from typing import Any, TextIO
 
-from uas_standards.eurocae_ed269 import ED269Schema
+from implicitdict import ImplicitDict
+from uas_standards.eurocae_ed269 import ED269Schema, UASZoneVersion
+
+READ_SIZE = 1 << 16
+"""Minimum number of characters read at once when streaming a file"""
+
+_WHITESPACE = " \t\n\r"
+
+_TRUNCATION_MARGIN = 16
+"""Decoding errors this close to the end of the buffer may be caused by a value cut by
+the read (literal, number or unicode escape) rather than by malformed JSON"""
 
 
 def loads(f: pathlib.Path) -> ED269Schema:
     json_body = json.loads(f.read_text(encoding="utf-8"))
     return ED269Schema.from_dict(json_body)
+
+
+class _JSONStream:
+    """Minimal incremental JSON reader decoding one value at a time from a buffered file."""
+
+    def __init__(self, f: TextIO):
+        self._f = f
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0
+        """Position of the start of the buffer in the file"""
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read more data, at least as much as is already buffered so that values
+        spanning many reads are decoded a logarithmic number of times."""
+        chunk = self._f.read(max(READ_SIZE, len(self._buf) - self._pos))
+        if not chunk:
+            return False
+        self._offset += self._pos
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it, "" at the end of the file."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, c: str) -> None:
+        found = self.peek()
+        if found != c:
+            raise ValueError(
+                f"Expected '{c}' but found '{found}' at character {self._offset + self._pos} of the file"
+            )
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                # Only read more when the buffer may end inside the value, so that
+                # malformed input fails without loading the rest of the file.
+                near_end = e.pos >= len(self._buf) - _TRUNCATION_MARGIN
+                unterminated = e.msg.startswith("Unterminated string")
+                if (near_end or unterminated) and self._fill():
+                    continue
+                raise ValueError(
+                    f"{e.msg} at character {self._offset + e.pos} of the file"
+                ) from e
+            # A number at the end of the buffer may continue in the next read
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_features(f: pathlib.Path) -> Iterator[UASZoneVersion]:
+    """Parse the features of the file one at a time without loading the whole file.
+    Other members of the document are checked against ED269Schema as in loads
+    once the file has been read entirely."""
+
+    with f.open(encoding="utf-8") as fp:
+        stream = _JSONStream(fp)
+        header: dict[str, Any] = {}
+
+        stream.expect("{")
+        while stream.peek() != "}":
+            key = stream.value()
+            stream.expect(":")
+            if key == "features":
+                header[key] = []
+                stream.expect("[")
+                while stream.peek() != "]":
+                    yield ImplicitDict.parse(stream.value(), UASZoneVersion)
+                    if stream.peek() != "]":
+                        stream.expect(",")
+                stream.expect("]")
+            else:
+                header[key] = stream.value()
+            if stream.peek() != "}":
+                stream.expect(",")
+        stream.expect("}")
+
+    ED269Schema.from_dict(header)
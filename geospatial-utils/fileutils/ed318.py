@@ -0,0 +1,177 @@
+import json
+import pathlib
+import struct
+from collections.abc import Iterable
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyproj
+
+PARQUET_ROW_GROUP_SIZE = 10_000
+"""Default number of rows buffered and written together as one Parquet row group"""
+
+PARQUET_SCHEMA = pa.schema(
+    [
+        pa.field("feature_id", pa.string(), nullable=False),
+        pa.field("volume", pa.int32(), nullable=False),
+        pa.field("identifier", pa.string()),
+        pa.field("country", pa.string()),
+        pa.field("name", pa.string()),
+        pa.field("type", pa.string()),
+        pa.field("variant", pa.string()),
+        pa.field("region", pa.int32()),
+        pa.field("reason", pa.list_(pa.string())),
+        pa.field("restriction_conditions", pa.string()),
+        pa.field("regulation_exemption", pa.string()),
+        pa.field("lower_limit", pa.float64()),
+        pa.field("lower_reference", pa.string()),
+        pa.field("upper_limit", pa.float64()),
+        pa.field("upper_reference", pa.string()),
+        pa.field("uom", pa.string()),
+        pa.field("radius", pa.float64()),
+        pa.field("geometry", pa.binary()),
+    ]
+)
+"""Columns of the Parquet export. One row is written per airspace volume of a feature."""
+
+_WKB_TYPES = {"Point": 1, "Polygon": 3}
+
+
+def dump_json(
+    collection: dict[str, Any], features: Iterable[dict[str, Any]], f: pathlib.Path
+) -> int:
+    """Write an ED-318 FeatureCollection to f, streaming the features one at a time.
+    collection holds the members of the FeatureCollection other than its features.
+    Return the number of features written."""
+
+    count = 0
+    with f.open("w", encoding="utf-8") as out:
+        out.write(json.dumps(collection)[:-1])
+        out.write(', "features": [' if collection else '"features": [')
+        for feature in features:
+            if count > 0:
+                out.write(", ")
+            out.write(json.dumps(feature))
+            count += 1
+        out.write("]}")
+    return count
+
+
+def _wkb(geometry: dict[str, Any]) -> bytes:
+    """Encode a Point or Polygon GeoJSON geometry as little-endian 2D WKB.
+    Altitudes of positions are dropped: vertical limits are exported from the layer."""
+    t = geometry["type"]
+    if t not in _WKB_TYPES:
+        raise NotImplementedError(f"Geometry type {t} is not supported in WKB export")
+
+    if t == "Point":
+        rings = [[geometry["coordinates"]]]
+    else:
+        rings = geometry["coordinates"]
+
+    out = bytearray(struct.pack("<BI", 1, _WKB_TYPES[t]))
+    if t == "Polygon":
+        out += struct.pack("<I", len(rings))
+    for ring in rings:
+        if t == "Polygon":
+            out += struct.pack("<I", len(ring))
+        for c in ring:
+            out += struct.pack("<dd", c[0], c[1])
+    return bytes(out)
+
+
+def _text(texts: list[dict[str, Any]] | None, lang: str) -> str | None:
+    """Select the text in the requested language, falling back to the first one."""
+    if not texts:
+        return None
+    for t in texts:
+        if t.get("lang") == lang:
+            return t.get("text")
+    return texts[0].get("text")
+
+
+def _rows(feature: dict[str, Any], lang: str) -> Iterable[dict[str, Any]]:
+    properties = feature.get("properties") or {}
+    geometry = feature.get("geometry") or {}
+    if geometry.get("type") == "GeometryCollection":
+        volumes = geometry["geometries"]
+    else:
+        volumes = [geometry]
+
+    for i, g in enumerate(volumes):
+        layer = g.get("layer") or {}
+        extent = g.get("extent") or {}
+        yield {
+            "feature_id": str(feature.get("id")),
+            "volume": i,
+            "identifier": properties.get("identifier"),
+            "country": properties.get("country"),
+            "name": _text(properties.get("name"), lang),
+            "type": properties.get("type"),
+            "variant": properties.get("variant"),
+            "region": properties.get("region"),
+            "reason": properties.get("reason"),
+            "restriction_conditions": properties.get("restrictionConditions"),
+            "regulation_exemption": properties.get("regulationExemption"),
+            "lower_limit": layer.get("lower"),
+            "lower_reference": layer.get("lowerReference"),
+            "upper_limit": layer.get("upper"),
+            "upper_reference": layer.get("upperReference"),
+            "uom": layer.get("uom"),
+            "radius": extent.get("radius"),
+            "geometry": _wkb(g),
+        }
+
+
+def _geo_metadata(crs: pyproj.CRS | str | None) -> dict[bytes, bytes]:
+    """GeoParquet file metadata describing the WKB geometry column."""
+    geometry_column: dict[str, Any] = {
+        "encoding": "WKB",
+        "geometry_types": list(_WKB_TYPES),
+    }
+    if crs is not None:
+        geometry_column["crs"] = pyproj.CRS.from_user_input(crs).to_json_dict()
+
+    geo = {
+        "version": "1.0.0",
+        "primary_column": "geometry",
+        "columns": {
+            "geometry": geometry_column,
+        },
+    }
+    return {b"geo": json.dumps(geo).encode("utf-8")}
+
+
+def dump_parquet(
+    features: Iterable[dict[str, Any]],
+    f: pathlib.Path,
+    lang: str,
+    crs: pyproj.CRS | str | None = None,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> int:
+    """Write ED-318 features to a GeoParquet file and return the number of rows written.
+    Features are expected in their JSON form. Multilingual texts are exported in lang.
+    crs is the coordinate reference system of the geometries, None for OGC:CRS84 (longitude, latitude).
+    At most row_group_size rows, plus the volumes of one feature, are held in memory before being written."""
+
+    schema = PARQUET_SCHEMA.with_metadata(_geo_metadata(crs))
+    count = 0
+    with pq.ParquetWriter(f, schema, compression="zstd") as writer:
+        batch: list[dict[str, Any]] = []
+        for feature in features:
+            batch.extend(_rows(feature, lang))
+            if len(batch) >= row_group_size:
+                writer.write_batch(
+                    pa.RecordBatch.from_pylist(batch, schema=schema),
+                    row_group_size=row_group_size,
+                )
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_batch(
+                pa.RecordBatch.from_pylist(batch, schema=schema),
+                row_group_size=row_group_size,
+            )
+            count += len(batch)
+    return count
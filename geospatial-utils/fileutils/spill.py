@@ -0,0 +1,45 @@
+import json
+import pathlib
+import tempfile
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Any
+
+from loguru import logger
+
+
+class FeatureSpill:
+    """Temporary on-disk store of features in their JSON form, one feature per line.
+    Features are appended as they are produced and read back sequentially, so that
+    only the feature being processed is held in memory."""
+
+    def __init__(self, directory: pathlib.Path | None = None):
+        self._file = tempfile.TemporaryFile(mode="w+", encoding="utf-8", dir=directory)
+        self.count = 0
+        """Number of features stored"""
+
+    def append(self, feature: dict[str, Any]) -> None:
+        self._file.write(json.dumps(feature))
+        self._file.write("\n")
+        self.count += 1
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        self._file.flush()
+        self._file.seek(0)
+        for line in self._file:
+            yield json.loads(line)
+
+    def close(self) -> None:
+        logger.debug(f"Discarding {self.count} spilled features")
+        self._file.close()
+
+    def __enter__(self) -> "FeatureSpill":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -1,20 +1,100 @@
 import argparse
+import itertools
 import json
 import os
 import pathlib
 import sys
+from collections.abc import Iterable
+from typing import Any
 
 import adjusters.foca
 import config
 import convert
 import fileutils
+import pyproj
+import reproject
 import validate
-from fileutils import ed269
+from fileutils import ed269, ed318
+from fileutils.spill import FeatureSpill
 from loguru import logger
+from pyproj.exceptions import CRSError
 
 version = os.environ.get("GEOSPATIAL_UTILS_VERSION", "unknown")
 
 
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return n
+
+
+def _save(
+    output: pathlib.Path, collection: dict[str, Any], features: Iterable[dict[str, Any]]
+) -> None:
+    ed318.dump_json(collection, features, output)
+    logger.debug(f"Successful conversion. File saved to: {output.absolute()}")
+
+
+def _check(
+    output: pathlib.Path, errors: list[validate.ValidationErrorWithPath]
+) -> None:
+    if len(errors) > 0:
+        for e in errors:
+            logger.error(f"{e.json_path}: {e.message}")
+        sys.exit(1)
+    logger.info(
+        f"Successful conversion and validation. ED-318 saved to {output.absolute()}"
+    )
+
+
+def _export(
+    args: argparse.Namespace,
+    features: Iterable[dict[str, Any]],
+    row_group_size: int = ed318.PARQUET_ROW_GROUP_SIZE,
+) -> None:
+    if not args.parquet_output:
+        return
+    parquet_output = pathlib.Path(args.parquet_output)
+    rows = ed318.dump_parquet(
+        features,
+        parquet_output,
+        config.FOCA.default_lang,
+        crs=None if reproject.is_wgs84(args.crs) else args.crs,
+        row_group_size=row_group_size,
+    )
+    logger.info(f"GeoParquet export ({rows} rows) saved to {parquet_output.absolute()}")
+
+
+def _convert_large_input(args: argparse.Namespace, source: pathlib.Path) -> None:
+    """Convert the source while holding at most args.batch_size features in memory.
+    Converted features are spilled to a temporary file and read back sequentially by
+    the output and validation stages."""
+
+    collection: dict[str, Any] = {
+        "type": "FeatureCollection",
+        "metadata": convert.to_ed318_metadata(config.FOCA),
+    }
+    output = pathlib.Path(args.output_file)
+
+    with FeatureSpill(directory=output.absolute().parent) as spill:
+        # Conversion, reprojection and adjustments by batch
+        features = convert.iter_ed318_features(
+            ed269.iter_features(source), config=config.FOCA
+        )
+        for batch in itertools.batched(features, args.batch_size):
+            reproject.reproject_features(
+                batch, target_crs=args.crs, source_crs=args.source_crs
+            )
+            for f in batch:
+                spill.append(adjusters.foca.adjust_feature(f))
+        logger.debug(f"{spill.count} features converted and spilled to disk")
+
+        _save(output, collection, spill)
+        _check(output, validate.ed318_features(collection, spill, args.batch_size))
+        _export(args, spill, row_group_size=args.batch_size)
+
+
 def main():
     logger.info(f"Geospatial utils - {version}")
 
@@ -36,46 +116,92 @@ def main():
         help="Time to live of the cached files after download in seconds (default: 0)",
         default="0",
     )
+    convert_cmd.add_argument(
+        "--parquet-output",
+        help="Path to an additional GeoParquet export of the converted features (default: none)",
+        default=None,
+    )
+    convert_cmd.add_argument(
+        "--source-crs",
+        help=f"Coordinate reference system of the ED-269 source file (default: {reproject.WGS84})",
+        default=reproject.WGS84,
+    )
+    convert_cmd.add_argument(
+        "--crs",
+        help=f"Coordinate reference system of the output, example: {reproject.LV95} (default: {reproject.WGS84})",
+        default=reproject.WGS84,
+    )
+    convert_cmd.add_argument(
+        "--large-input",
+        help="Spill converted features to a temporary file next to the output instead of holding them in memory",
+        action="store_true",
+    )
+    convert_cmd.add_argument(
+        "-b",
+        "--batch-size",
+        help="Maximum number of converted features held in memory with --large-input (default: 1000)",
+        type=_positive_int,
+        default=1000,
+    )
 
     args = parser.parse_args()
 
     if args.command == "convert":
+        try:
+            args.source_crs = pyproj.CRS.from_user_input(args.source_crs)
+            args.crs = pyproj.CRS.from_user_input(args.crs)
+        except CRSError as e:
+            convert_cmd.error(str(e))
+
         logger.debug(f"Converting {args.input_url} to {args.output_file}")
         source = fileutils.get(args.input_url, int(args.ttl))
         logger.debug(f"Local input copy: {source.absolute()}")
 
-        # Load source
-        ed269_data = ed269.loads(source)
         # TODO: Move hard-coded configuration to a json file.
         logger.warning(
             "Additional data not provided in ED269 is hard-coded with Swiss FOCA information. This will be moved to a configurable file in the near future."
         )
+        logger.warning(
+            "The output is adjusted with Swiss FOCA configuration. The output contains non-conform ConditionExpressionType values."
+        )
+        if not reproject.is_wgs84(args.crs):
+            logger.warning(
+                f"The output coordinates are in {args.crs.name} ({args.crs.to_string()}) rather than WGS84. The output is not conform to ED-318, whose consumers read coordinates as WGS84 longitude and latitude."
+            )
+
+        if args.large_input:
+            _convert_large_input(args, source)
+            return
+
+        # Load source
+        ed269_data = ed269.loads(source)
 
         # Conversion
         ed318_data = convert.from_ed269_to_ed318(ed269_data, config=config.FOCA)
 
-        # Adjustments
-        logger.warning(
-            "The output is adjusted with Swiss FOCA configuration. The output contains non-conform ConditionExpressionType values."
+        # Reprojection
+        ed318_data = reproject.reproject(
+            ed318_data, target_crs=args.crs, source_crs=args.source_crs
         )
+
+        # Adjustments
         ed318_data = adjusters.foca.adjust(ed318_data)
 
         # Save to file
         output = pathlib.Path(args.output_file)
-        json_output = json.dumps(ed318_data)
-        output.write_text(json_output, encoding="utf-8")
-        logger.debug(f"Successful conversion. File saved to: {output.absolute()}")
-
-        # Validation
-        errors = validate.ed318(json.loads(json_output))
-        if len(errors) > 0:
-            for e in errors:
-                logger.error(f"{e.json_path}: {e.message}")
-            sys.exit(1)
-        logger.info(
-            f"Successful conversion and validation. ED-318 saved to {output.absolute()}"
+        _save(
+            output,
+            {k: v for k, v in ed318_data.items() if k != "features"},
+            ed318_data["features"],
         )
 
+        # Validation of the written file
+        ed318_json = json.loads(output.read_text(encoding="utf-8"))
+        _check(output, validate.ed318(ed318_json))
+
+        # Columnar export
+        _export(args, ed318_json["features"])
+
     else:
         parser.print_help()
         sys.exit(1)
@@ -0,0 +1,90 @@
+import functools
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pyproj
+from uas_standards.eurocae_ed318 import ED318Schema, Feature
+
+WGS84 = "EPSG:4326"
+"""World Geodetic System 1984, coordinates of ED-318 GeoJSON output (longitude, latitude)"""
+
+LV95 = "EPSG:2056"
+"""Swiss CH1903+ / LV95 projected coordinate system"""
+
+
+def is_wgs84(crs: pyproj.CRS | str) -> bool:
+    """Whether crs is the WGS84 coordinate reference system expected in ED-318 GeoJSON output."""
+    # Axis order is irrelevant since transformers always use longitude, latitude order
+    return pyproj.CRS.from_user_input(crs).equals(WGS84, ignore_axis_order=True)
+
+
+@functools.cache
+def _transformer(
+    source_crs: pyproj.CRS | str, target_crs: pyproj.CRS | str
+) -> pyproj.Transformer:
+    """Build the transformer between two CRSs once.
+    It is reused across the batches and calls of a single run."""
+    return pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
+def _positions(coordinates: Any) -> Iterator[list[float]]:
+    """Yield every position of nested GeoJSON coordinates."""
+    if not coordinates:
+        return
+    if isinstance(coordinates[0], int | float):
+        yield coordinates
+        return
+    for c in coordinates:
+        yield from _positions(c)
+
+
+def _geometry_positions(geometry: dict[str, Any]) -> Iterator[list[float]]:
+    if geometry.get("type") == "GeometryCollection":
+        for g in geometry.get("geometries") or []:
+            yield from _geometry_positions(g)
+    else:
+        yield from _positions(geometry.get("coordinates"))
+
+
+def reproject_features(
+    features: Iterable[Feature],
+    target_crs: pyproj.CRS | str,
+    source_crs: pyproj.CRS | str = WGS84,
+) -> None:
+    """Transform the horizontal coordinates of features from source_crs to target_crs.
+    Positions of all features are transformed in place in a single batch."""
+
+    if pyproj.CRS.from_user_input(source_crs).equals(
+        target_crs, ignore_axis_order=True
+    ):
+        return
+
+    positions = [
+        p
+        for f in features
+        if "geometry" in f and f.geometry
+        for p in _geometry_positions(f.geometry)
+    ]
+    if len(positions) == 0:
+        return
+
+    xs = array("d", (p[0] for p in positions))
+    ys = array("d", (p[1] for p in positions))
+    _transformer(source_crs, target_crs).transform(xs, ys, inplace=True, errcheck=True)
+
+    for p, x, y in zip(positions, xs, ys, strict=True):
+        p[0] = x
+        p[1] = y
+
+
+def reproject(
+    ed318_data: ED318Schema,
+    target_crs: pyproj.CRS | str,
+    source_crs: pyproj.CRS | str = WGS84,
+) -> ED318Schema:
+    """Transform the horizontal coordinates of all features from source_crs to target_crs.
+    Positions of all features are transformed in place in a single batch."""
+
+    reproject_features(ed318_data.features, target_crs, source_crs)
+    return ed318_data
@@ -1,7 +1,11 @@
 # Validation script extensively inspired from https://github.com/UASGeoZones/ED-318/blob/main/examples/validate_examples.py
 
+import functools
+import itertools
 import json
 import os
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -43,15 +47,56 @@ def _build_registry(schema_dir: Path) -> Registry:
     return registry
 
 
-def ed318(data: dict[str, Any]) -> list[ValidationErrorWithPath]:
-    """Validate the data object using ED-318 jsonschemas"""
+@functools.cache
+def _ed318_validator() -> jsonschema.Draft7Validator:
     schema_content = json.loads(ROOT_SCHEMA.read_bytes())
     registry = _build_registry(SCHEMA_PATH)
     validator = jsonschema.Draft7Validator(schema=schema_content, registry=registry)
     validator.check_schema(schema_content)
+    return validator
+
+
+def ed318(data: dict[str, Any]) -> list[ValidationErrorWithPath]:
+    """Validate the data object using ED-318 jsonschemas"""
+    validator = _ed318_validator()
 
     errors: list[ValidationErrorWithPath] = []
     for e in validator.iter_errors(data):  # type: ignore
         errors.extend(_collect_errors(e))
 
     return errors
+
+
+_FEATURE_INDEX = re.compile(r"^\$\.features\[(\d+)\]")
+
+
+def ed318_features(
+    collection: dict[str, Any],
+    features: Iterable[dict[str, Any]],
+    chunk_size: int,
+) -> list[ValidationErrorWithPath]:
+    """Validate a FeatureCollection whose features are provided as an iterable.
+    collection holds the members of the FeatureCollection other than its features.
+    Features are validated chunk_size at a time so that the whole collection is never held in memory."""
+
+    errors: list[ValidationErrorWithPath] = []
+    offset = 0
+    for chunk in itertools.batched(features, chunk_size):
+        chunk_errors = ed318({**collection, "features": list(chunk)})
+        for e in chunk_errors:
+            # Report paths relative to the whole collection rather than to the chunk
+            e.json_path = _FEATURE_INDEX.sub(
+                lambda m: f"$.features[{int(m.group(1)) + offset}]", e.json_path
+            )
+        if offset > 0:
+            # Errors not related to a feature were already reported with the first chunk
+            chunk_errors = [
+                e for e in chunk_errors if _FEATURE_INDEX.match(e.json_path)
+            ]
+        errors.extend(chunk_errors)
+        offset += len(chunk)
+
+    if offset == 0:
+        errors.extend(ed318({**collection, "features": []}))
+
+    return errors